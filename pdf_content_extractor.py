@@ -14,8 +14,16 @@ import json
 import re
 import argparse
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from contextlib import ExitStack
+from dataclasses import dataclass
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from statistics import median
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import warnings
 
 # Suppress warnings for cleaner output
@@ -39,38 +47,182 @@ except ImportError:
     print("Warning: camelot-py not installed. Table extraction may be limited.")
     camelot = None
 
+try:
+    import orjson  # Optional: faster JSON serialization
+except ImportError:
+    orjson = None
+
+
+# Section detection patterns
+_SECTION_PATTERNS = (
+    r'^\s*([A-Z][A-Za-z\s]+)\s*$',  # All caps or title case headings
+    r'^\s*\d+\.\s+([A-Za-z][A-Za-z\s]+)\s*$',  # Numbered sections
+    r'^\s*([A-Z]+[A-Z\s]*[A-Z]+)\s*$',  # ALL CAPS sections
+    r'^\s*Chapter\s+\d+[:\.]?\s*([A-Za-z][A-Za-z\s]+)\s*$',  # Chapter headings
+)
+
+_SUBSECTION_PATTERNS = (
+    r'^\s*\d+\.\d+\.?\s+([A-Za-z][A-Za-z\s]+)\s*$',  # 1.1, 1.2, etc.
+    r'^\s*[a-z]\)\s+([A-Za-z][A-Za-z\s]+)\s*$',  # a), b), etc.
+    r'^\s*[A-Z]\)\s+([A-Za-z][A-Za-z\s]+)\s*$',  # A), B), etc.
+)
+
+# All heading patterns fused into one alternation; sections are tried before
+# subsections, and each alternative is named "<kind>_<index>" so a match can
+# be classified from ``m.lastgroup``.
+_HEADING_RE = re.compile("|".join(
+    [f"(?P<section_{i}>{p})" for i, p in enumerate(_SECTION_PATTERNS)] +
+    [f"(?P<subsection_{i}>{p})" for i, p in enumerate(_SUBSECTION_PATTERNS)]
+))
+
+
+# Image file extension for each PDF stream filter, matching what PyMuPDF's
+# extract_image reports; other filters are re-encoded by it as PNG
+_FILTER_EXTENSIONS = {
+    "DCTDecode": "jpeg",
+    "JPXDecode": "jpx",
+    "JBIG2Decode": "jb2",
+}
+
+# Word/line grouping tolerances in points, matching pdfplumber's defaults:
+# maximum horizontal gap between characters of a word, and maximum
+# difference in "top" for words to be on the same line
+_WORD_TOLERANCE = 3
+_LINE_TOLERANCE = 3
+
+# A line starting further below the previous line's top than this multiple
+# of the page's median line spacing begins a new paragraph
+_PARAGRAPH_GAP = 1.5
+
+# Pages extracted together: one camelot call per block, and the unit of work
+# (and of memory) for page workers
+_BLOCK_PAGES = 8
+
+# Supported values for the table_backend option
+TABLE_BACKENDS = ("auto", "pdfplumber", "camelot")
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON indented by two spaces.
+
+    Uses orjson when installed, falling back to the standard library json
+    module; both produce the same layout.
+
+    Args:
+        obj (Any): Object to serialize
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+@dataclass
+class Paragraph:
+    """A paragraph of text, positioned by its vertical offset on the page."""
+    __slots__ = ("section", "sub_section", "text", "position")
+
+    section: Optional[str]
+    sub_section: Optional[str]
+    text: str
+    position: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to the output JSON representation."""
+        return {
+            "type": "paragraph",
+            "section": self.section,
+            "sub_section": self.sub_section,
+            "text": self.text
+        }
+
+
+@dataclass
+class TableItem:
+    """A table, positioned by its vertical offset on the page."""
+    __slots__ = ("section", "sub_section", "description", "table_data", "position")
+
+    section: Optional[str]
+    sub_section: Optional[str]
+    description: str
+    table_data: List[List[str]]
+    position: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to the output JSON representation."""
+        return {
+            "type": "table",
+            "section": self.section,
+            "sub_section": self.sub_section,
+            "description": self.description,
+            "table_data": self.table_data
+        }
+
+
+@dataclass
+class Chart:
+    """An image or chart (metadata only)."""
+    __slots__ = ("section", "sub_section", "description", "image_info")
+
+    section: Optional[str]
+    sub_section: Optional[str]
+    description: str
+    image_info: Dict[str, Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to the output JSON representation."""
+        return {
+            "type": "chart",
+            "section": self.section,
+            "sub_section": self.sub_section,
+            "description": self.description,
+            "image_info": self.image_info,
+            "table_data": None  # Would need OCR or manual processing for chart data
+        }
+
+
+@dataclass
+class Heading:
+    """A section or subsection heading; updates context but is not output."""
+    __slots__ = ("kind", "text", "position")
+
+    kind: str  # "section" or "subsection"
+    text: str
+    position: float
+
 
 class PDFContentExtractor:
     """
     Main class for extracting structured content from PDF files.
     """
 
-    def __init__(self, pdf_path: str, verbose: bool = False):
+    def __init__(self, pdf_path: str, verbose: bool = False, workers: int = 1,
+                 table_backend: str = "auto"):
         """
         Initialize the PDF extractor.
 
         Args:
             pdf_path (str): Path to the PDF file
             verbose (bool): Enable verbose logging
+            workers (int): Number of worker processes for page extraction
+                (default: 1, extract in the calling process). Values above 1
+                start a process pool, so the calling script needs an
+                ``if __name__ == "__main__":`` guard
+            table_backend (str): Table extractor to use: "pdfplumber", "camelot",
+                or "auto" (pdfplumber, falling back to camelot on pages without tables)
         """
+        if table_backend not in TABLE_BACKENDS:
+            raise ValueError(f"Unknown table backend: {table_backend}")
+
         self.pdf_path = Path(pdf_path)
         self.verbose = verbose
+        self.workers = workers
+        self.table_backend = table_backend
         self.setup_logging()
 
-        # Section detection patterns
-        self.section_patterns = [
-            r'^\s*([A-Z][A-Za-z\s]+)\s*$',  # All caps or title case headings
-            r'^\s*\d+\.\s+([A-Za-z][A-Za-z\s]+)\s*$',  # Numbered sections
-            r'^\s*([A-Z]+[A-Z\s]*[A-Z]+)\s*$',  # ALL CAPS sections
-            r'^\s*Chapter\s+\d+[:\.]?\s*([A-Za-z][A-Za-z\s]+)\s*$',  # Chapter headings
-        ]
-
-        self.subsection_patterns = [
-            r'^\s*\d+\.\d+\.?\s+([A-Za-z][A-Za-z\s]+)\s*$',  # 1.1, 1.2, etc.
-            r'^\s*[a-z]\)\s+([A-Za-z][A-Za-z\s]+)\s*$',  # a), b), etc.
-            r'^\s*[A-Z]\)\s+([A-Za-z][A-Za-z\s]+)\s*$',  # A), B), etc.
-        ]
-
         # Current context for hierarchical tracking
         self.current_section = None
         self.current_subsection = None
@@ -91,133 +243,399 @@ class PDFContentExtractor:
         Returns:
             Dict containing structured PDF content
         """
+        metadata = self.extract_metadata()
+        result = {
+            "metadata": metadata,
+            "pages": [self.page_to_dict(page_data)
+                      for page_data in self.iter_pages(metadata["total_pages"])]
+        }
+
+        self.logger.info("Extraction completed successfully")
+        return result
+
+    def extract_to_json(self, output_path: str) -> Dict[str, Any]:
+        """
+        Extract all content from PDF, streaming it to a JSON file page by page.
+
+        Produces the same document as extract_content followed by
+        save_to_json, but holds only the pages currently being extracted in
+        memory: one block of pages when running serially, and at most two
+        blocks per worker in parallel mode.
+
+        Args:
+            output_path (str): Output file path
+
+        Returns:
+            Dict containing the document metadata
+        """
+        metadata = self.extract_metadata()
+        output_file = Path(output_path)
+
+        # Stream into a temporary file next to the output and move it into
+        # place only once every page is written, so a failed run never
+        # leaves a truncated document behind
+        temp_file = output_file.with_name(f".{output_file.name}.{os.getpid()}.tmp")
+
+        try:
+            with self.log_save_errors(open)(temp_file, 'wb') as f:
+                write = self.log_save_errors(f.write)
+                write(b'{\n  "metadata": ')
+                write(_dumps(metadata).replace(b'\n', b'\n  '))
+                write(b',\n  "pages": [')
+
+                separator = b'\n    '
+                for page_data in self.iter_pages(metadata["total_pages"]):
+                    write(separator)
+                    write(_dumps(self.page_to_dict(page_data)).replace(b'\n', b'\n    '))
+                    separator = b',\n    '
+
+                # An empty page list is closed on the same line, as json.dump does
+                write(b']\n}' if separator == b'\n    ' else b'\n  ]\n}')
+
+            self.log_save_errors(os.replace)(temp_file, output_file)
+            self.logger.info(f"JSON output saved to: {output_file}")
+
+        finally:
+            if temp_file.exists():
+                temp_file.unlink()
+
+        self.logger.info("Extraction completed successfully")
+        return metadata
+
+    def log_save_errors(self, func):
+        """
+        Wrap a file operation so I/O failures are logged as save errors.
+
+        Extraction errors raised while streaming pages pass through unlogged,
+        as they do from extract_content.
+
+        Args:
+            func: Callable performing the file operation
+
+        Returns:
+            Wrapped callable that logs and re-raises OSError
+        """
+        def wrapper(*args):
+            try:
+                return func(*args)
+            except OSError as e:
+                self.logger.error(f"Error saving JSON file: {e}")
+                raise
+        return wrapper
+
+    def extract_metadata(self) -> Dict[str, Any]:
+        """
+        Build the document metadata.
+
+        Returns:
+            Dict containing source file, page count and extraction timestamp
+        """
         if not self.pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {self.pdf_path}")
 
         self.logger.info(f"Starting extraction from: {self.pdf_path}")
 
-        result = {
-            "metadata": {
-                "source_file": str(self.pdf_path),
-                "total_pages": 0,
-                "extraction_timestamp": "",
-            },
-            "pages": []
+        # PyMuPDF reads the page count without building every page object
+        with fitz.open(self.pdf_path) as doc:
+            total_pages = doc.page_count
+
+        from datetime import datetime
+        return {
+            "source_file": str(self.pdf_path),
+            "total_pages": total_pages,
+            "extraction_timestamp": datetime.now().isoformat(),
         }
 
-        # Extract content using pdfplumber
-        with pdfplumber.open(self.pdf_path) as pdf:
-            result["metadata"]["total_pages"] = len(pdf.pages)
+    def iter_pages(self, total_pages: int) -> Iterator[Dict[str, Any]]:
+        """
+        Extract content page by page, in document order.
 
-            for page_num, page in enumerate(pdf.pages, 1):
-                self.logger.debug(f"Processing page {page_num}")
-                page_content = self.extract_page_content(page, page_num)
-                result["pages"].append(page_content)
+        Args:
+            total_pages (int): Number of pages in the PDF
+
+        Yields:
+            Dict containing page content
+        """
+        if self.table_backend == "camelot" and camelot is None:
+            self.logger.warning("camelot-py not installed; no tables will be extracted")
+
+        blocks = [(start, min(start + _BLOCK_PAGES, total_pages))
+                  for start in range(0, total_pages, _BLOCK_PAGES)]
+
+        with ExitStack() as stack:
+            # Extract raw page content, in parallel when there is more than one worker
+            workers = min(self.workers, len(blocks))
+            if workers > 1:
+                self.logger.debug("Extracting %d pages with %d workers", total_pages, workers)
+                executor = stack.enter_context(ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker,
+                    initargs=(str(self.pdf_path), self.verbose, self.table_backend)
+                ))
+                raw_blocks = self.map_blocks(executor, blocks, window=workers * 2)
+            else:
+                # Open each library once for the whole run; blocks only group
+                # pages for camelot calls
+                pdf = stack.enter_context(pdfplumber.open(self.pdf_path))
+                doc = stack.enter_context(fitz.open(self.pdf_path))
+                raw_blocks = (self.extract_page_block(pdf, doc, start, stop)
+                              for start, stop in blocks)
+            raw_pages = chain.from_iterable(raw_blocks)
+
+            # Section tracking depends on document order, so resolve it serially
+            for raw_page in raw_pages:
+                yield self.assemble_page(raw_page)
+
+    def map_blocks(self, executor, blocks: List[Tuple[int, int]],
+                   window: int) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Extract page blocks in worker processes, yielding results in order.
 
-        # Add charts/images using PyMuPDF
-        self.extract_charts_and_images(result)
+        At most ``window`` blocks are submitted or waiting to be consumed at
+        any time, so finished blocks cannot pile up behind a slow one.
 
-        # Add timestamp
-        from datetime import datetime
-        result["metadata"]["extraction_timestamp"] = datetime.now().isoformat()
+        Args:
+            executor: Process pool set up with _init_worker
+            blocks (List[Tuple[int, int]]): (start, stop) page index ranges
+            window (int): Maximum number of blocks in flight
 
-        self.logger.info("Extraction completed successfully")
-        return result
+        Yields:
+            Lists of raw page dictionaries, one per block
+        """
+        pending = deque()
+        for start, stop in blocks:
+            pending.append(executor.submit(_extract_page_range, start, stop))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    def extract_page_block(self, pdf, doc, start: int, stop: int) -> List[Dict[str, Any]]:
+        """
+        Extract raw content from a contiguous block of pages.
+
+        Args:
+            pdf: Open pdfplumber PDF
+            doc: Open PyMuPDF document
+            start (int): Index of the first page (0-based)
+            stop (int): Index one past the last page
+
+        Returns:
+            List of raw page dictionaries (see extract_page_content)
+        """
+        # Text/tables come from pdfplumber, charts/images from PyMuPDF, in one pass
+        raw_pages = []
+        for page_idx in range(start, stop):
+            page_num = page_idx + 1
+            self.logger.debug("Processing page %d", page_num)
+            page = pdf.pages[page_idx]
+            raw_pages.append(self.extract_page_content(page, page_num, doc.load_page(page_idx)))
+            # Drop the page's cached layout objects; the document stays open
+            page.close()
+
+        # Camelot covers every page (camelot backend) or only the pages
+        # where pdfplumber found no tables (auto), in a single call
+        if camelot and self.table_backend != "pdfplumber":
+            camelot_tables = self.read_camelot_tables(
+                [raw_page["page_number"] for raw_page in raw_pages if not raw_page["tables"]]
+            )
+            for raw_page in raw_pages:
+                page_num = raw_page["page_number"]
+                if page_num in camelot_tables:
+                    raw_page["tables"] = self.extract_camelot_tables(
+                        camelot_tables[page_num], page_num, pdf.pages[page_num - 1].height
+                    )
+
+        return raw_pages
+
+    def read_camelot_tables(self, page_numbers: List[int]) -> Dict[int, List]:
+        """
+        Read camelot tables for a set of pages in a single pass.
+
+        Camelot re-parses the whole file on every call, so all pages are read
+        at once rather than page by page.
+
+        Args:
+            page_numbers (List[int]): Page numbers to read
+
+        Returns:
+            Dict mapping page number to the camelot tables found on it
+        """
+        camelot_tables = {}
+        if not page_numbers:
+            return camelot_tables
+
+        pages = ",".join(map(str, page_numbers))
+        try:
+            for table in camelot.read_pdf(str(self.pdf_path), pages=pages):
+                camelot_tables.setdefault(int(table.page), []).append(table)
+        except Exception as e:
+            self.logger.debug("Camelot extraction failed for pages %s: %s", pages, e)
 
-    def extract_page_content(self, page, page_num: int) -> Dict[str, Any]:
+        return camelot_tables
+
+    def extract_page_content(self, page, page_num: int, fitz_page=None) -> Dict[str, Any]:
         """
-        Extract content from a single page.
+        Extract raw content from a single page.
+
+        Section context is not resolved here, since it depends on the pages
+        before this one; see assemble_page.
 
         Args:
             page: pdfplumber page object
             page_num (int): Page number
+            fitz_page: PyMuPDF page object for chart/image extraction
 
         Returns:
-            Dict containing page content
+            Dict containing page number, tables, text items and charts
         """
-        page_data = {
-            "page_number": page_num,
-            "content": []
-        }
-
         # Extract tables first
         tables = self.extract_tables(page, page_num)
 
         # Extract text content
         text_content = self.extract_text_content(page, page_num, tables)
 
-        # Combine and sort by position
-        all_content = tables + text_content
+        # Extract charts/images
+        charts = self.extract_charts(fitz_page, page_num) if fitz_page is not None else []
 
-        # Sort by approximate vertical position
-        all_content.sort(key=lambda x: x.get('_position', 0))
+        return {
+            "page_number": page_num,
+            "tables": tables,
+            "text": text_content,
+            "charts": charts
+        }
 
-        # Remove temporary position markers
-        for item in all_content:
-            item.pop('_position', None)
+    def assemble_page(self, raw_page: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Resolve section context for a raw page and order its content.
+
+        Must be called on pages in document order.
+
+        Args:
+            raw_page (Dict): Raw page dictionary from extract_page_content
+
+        Returns:
+            Dict containing page number and content items
+        """
+        page_data = {
+            "page_number": raw_page["page_number"],
+            "content": []
+        }
+
+        # Order tables, paragraphs and headings by vertical position
+        items = raw_page["tables"] + raw_page["text"]
+        items.sort(key=attrgetter('position'))
+
+        # Walk the page top to bottom, updating context at each heading, so
+        # every table and paragraph takes the heading above it
+        all_content = []
+        for item in items:
+            if isinstance(item, Heading):
+                if item.kind == "section":
+                    self.current_section = item.text
+                    self.current_subsection = None
+                else:
+                    self.current_subsection = item.text
+            else:
+                item.section = self.current_section
+                item.sub_section = self.current_subsection
+                all_content.append(item)
+
+        # Charts follow the page text and take the context at the end of the page
+        for chart in raw_page["charts"]:
+            chart.section = self.current_section
+            chart.sub_section = self.current_subsection
+            all_content.append(chart)
 
         page_data["content"] = all_content
         return page_data
 
-    def extract_tables(self, page, page_num: int) -> List[Dict[str, Any]]:
+    def page_to_dict(self, page_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Serialize an assembled page to its output JSON representation.
+
+        Args:
+            page_data (Dict): Page dictionary from assemble_page
+
+        Returns:
+            Dict containing page number and content dictionaries
+        """
+        return {
+            "page_number": page_data["page_number"],
+            "content": [item.to_dict() for item in page_data["content"]]
+        }
+
+    def extract_tables(self, page, page_num: int) -> List[TableItem]:
         """
-        Extract tables from a page.
+        Extract tables from a page using pdfplumber.
+
+        Camelot tables are added per block of pages; see extract_page_block.
 
         Args:
             page: pdfplumber page object
             page_num (int): Page number
 
         Returns:
-            List of table dictionaries
+            List of table items
         """
         tables = []
 
-        try:
-            # Extract tables using pdfplumber
-            page_tables = page.extract_tables()
-
-            for i, table_data in enumerate(page_tables):
-                if table_data and len(table_data) > 1:  # Must have header + data
-                    table_dict = {
-                        "type": "table",
-                        "section": self.current_section,
-                        "sub_section": self.current_subsection,
-                        "description": f"Table {i+1} from page {page_num}",
-                        "table_data": self.clean_table_data(table_data),
-                        "_position": self.get_table_position(page, i)
-                    }
-                    tables.append(table_dict)
-                    self.logger.debug(f"Extracted table {i+1} from page {page_num}")
-
-        except Exception as e:
-            self.logger.warning(f"Error extracting tables from page {page_num}: {e}")
-
-        # Try camelot for better table extraction if available
-        if camelot and len(tables) == 0:
+        # Extract tables using pdfplumber
+        if self.table_backend != "camelot":
             try:
-                camelot_tables = camelot.read_pdf(str(self.pdf_path), pages=str(page_num))
-                for i, table in enumerate(camelot_tables):
-                    if not table.df.empty:
-                        table_data = table.df.values.tolist()
-                        headers = table.df.columns.tolist()
-                        full_table = [headers] + table_data
-
-                        table_dict = {
-                            "type": "table",
-                            "section": self.current_section,
-                            "sub_section": self.current_subsection,
-                            "description": f"Table {i+1} from page {page_num} (camelot)",
-                            "table_data": self.clean_table_data(full_table),
-                            "_position": 300  # Approximate middle position
-                        }
-                        tables.append(table_dict)
+                for i, table in enumerate(page.find_tables()):
+                    table_data = table.extract()
+                    if table_data and len(table_data) > 1:  # Must have header + data
+                        tables.append(TableItem(
+                            section=None,
+                            sub_section=None,
+                            description=f"Table {i+1} from page {page_num}",
+                            table_data=self.clean_table_data(table_data),
+                            position=table.bbox[1]  # Top of the table
+                        ))
+                        self.logger.debug("Extracted table %d from page %d", i + 1, page_num)
 
             except Exception as e:
-                self.logger.debug(f"Camelot extraction failed for page {page_num}: {e}")
+                self.logger.warning(f"Error extracting tables from page {page_num}: {e}")
+
+        return tables
+
+    def extract_camelot_tables(self, camelot_tables: List, page_num: int,
+                               page_height: float) -> List[TableItem]:
+        """
+        Convert camelot tables found on a page to table items.
+
+        Args:
+            camelot_tables (List): Camelot tables for the page
+            page_num (int): Page number
+            page_height (float): Page height, for positioning
+
+        Returns:
+            List of table items
+        """
+        tables = []
+
+        try:
+            for i, table in enumerate(camelot_tables):
+                if not table.df.empty:
+                    table_data = table.df.values.tolist()
+                    headers = table.df.columns.tolist()
+                    full_table = [headers] + table_data
+
+                    tables.append(TableItem(
+                        section=None,
+                        sub_section=None,
+                        description=f"Table {i+1} from page {page_num} (camelot)",
+                        table_data=self.clean_table_data(full_table),
+                        position=page_height / 2  # Approximate middle position
+                    ))
+
+        except Exception as e:
+            self.logger.debug("Camelot extraction failed for page %d: %s", page_num, e)
 
         return tables
 
-    def extract_text_content(self, page, page_num: int, existing_tables: List) -> List[Dict[str, Any]]:
+    def extract_text_content(self, page, page_num: int, existing_tables: List) -> List[Any]:
         """
         Extract text content from a page.
 
@@ -227,75 +645,71 @@ class PDFContentExtractor:
             existing_tables (List): Already extracted tables to avoid duplication
 
         Returns:
-            List of text content dictionaries
+            List of paragraphs and section/subsection headings, in reading order
         """
         content = []
 
         try:
-            # Extract text
-            text = page.extract_text()
-            if not text:
+            # Extract words once, top to bottom (the same order assemble_page
+            # sorts by), and rebuild lines from them
+            words = page.extract_words(
+                x_tolerance=_WORD_TOLERANCE,
+                y_tolerance=_LINE_TOLERANCE
+            )
+            lines = self.group_lines(words)
+            if not lines:
                 return content
 
-            # Split into lines and process
-            lines = text.split('\n')
             current_paragraph = []
-
-            for line_num, line in enumerate(lines):
-                line = line.strip()
-                if not line:
-                    # Empty line - end current paragraph
-                    if current_paragraph:
-                        content.append(self.create_paragraph_dict(
-                            ' '.join(current_paragraph), 
-                            page_num, 
-                            line_num
-                        ))
-                        current_paragraph = []
-                    continue
+            paragraph_tops = []
+            join = ' '.join
+
+            # Typical line spacing on the page, for spotting paragraph gaps
+            pitches = [b_top - a_top for (_, a_top), (_, b_top) in zip(lines, lines[1:])]
+            max_gap = median(pitches) * _PARAGRAPH_GAP if pitches else 0.0
+            prev_top = None
+
+            for line, top in lines:
+                # A gap well beyond the usual line spacing ends the current paragraph
+                if current_paragraph and top - prev_top > max_gap:
+                    content.append(self.create_paragraph(
+                        join(current_paragraph), 
+                        page_num, 
+                        sum(paragraph_tops) / len(paragraph_tops)
+                    ))
+                    current_paragraph = []
+                    paragraph_tops = []
+                prev_top = top
 
                 # Check if line is a section/subsection heading
-                section_match = self.detect_section(line)
-                subsection_match = self.detect_subsection(line)
-
-                if section_match:
-                    # Save current paragraph if exists
-                    if current_paragraph:
-                        content.append(self.create_paragraph_dict(
-                            ' '.join(current_paragraph), 
-                            page_num, 
-                            line_num
-                        ))
-                        current_paragraph = []
-
-                    self.current_section = section_match
-                    self.current_subsection = None
-                    self.logger.debug(f"Found section: {section_match}")
-                    continue
+                kind, heading = self.classify_line(line)
 
-                elif subsection_match:
+                if kind is not None:
                     # Save current paragraph if exists
                     if current_paragraph:
-                        content.append(self.create_paragraph_dict(
-                            ' '.join(current_paragraph), 
+                        content.append(self.create_paragraph(
+                            join(current_paragraph), 
                             page_num, 
-                            line_num
+                            sum(paragraph_tops) / len(paragraph_tops)
                         ))
                         current_paragraph = []
+                        paragraph_tops = []
 
-                    self.current_subsection = subsection_match
-                    self.logger.debug(f"Found subsection: {subsection_match}")
+                    # Heading marker, resolved into context by assemble_page
+                    content.append(Heading(kind, heading, top))
+                    self.logger.debug("Found %s: %s", kind, heading)
                     continue
 
                 # Regular text line
                 current_paragraph.append(line)
+                paragraph_tops.append(top)
 
             # Add final paragraph if exists
             if current_paragraph:
-                content.append(self.create_paragraph_dict(
-                    ' '.join(current_paragraph), 
+                content.append(self.create_paragraph(
+                    join(current_paragraph), 
                     page_num, 
-                    len(lines)
+                    sum(paragraph_tops) / len(paragraph_tops)
                 ))
 
         except Exception as e:
@@ -303,107 +717,149 @@ class PDFContentExtractor:
 
         return content
 
-    def extract_charts_and_images(self, result: Dict[str, Any]):
+    def group_lines(self, words: List[Dict[str, Any]]) -> List[Tuple[str, float]]:
+        """
+        Group words into text lines.
+
+        Args:
+            words (List[Dict]): Words from pdfplumber's extract_words, in reading order
+
+        Returns:
+            List of (line text, top coordinate) tuples
+        """
+        lines = []
+        line_words = []
+        line_top = 0.0
+
+        for word in words:
+            if line_words and abs(word["top"] - line_top) > _LINE_TOLERANCE:
+                lines.append((' '.join(line_words), line_top))
+                line_words = []
+            if not line_words:
+                line_top = word["top"]
+            line_words.append(word["text"])
+
+        if line_words:
+            lines.append((' '.join(line_words), line_top))
+        return lines
+
+    def extract_charts(self, fitz_page, page_num: int) -> List[Chart]:
         """
-        Extract charts and images using PyMuPDF.
+        Extract charts and images from a page using PyMuPDF.
 
         Args:
-            result (Dict): The result dictionary to update
+            fitz_page: PyMuPDF page object
+            page_num (int): Page number
+
+        Returns:
+            List of chart items
         """
+        charts = []
+
         try:
-            doc = fitz.open(self.pdf_path)
-
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                image_list = page.get_images()
-
-                if image_list:
-                    page_content = result["pages"][page_num]["content"]
-
-                    for img_index, img in enumerate(image_list):
-                        # Get image info
-                        xref = img[0]
-                        try:
-                            base_image = doc.extract_image(xref)
-                            image_data = base_image["image"]
-
-                            # Create chart entry
-                            chart_dict = {
-                                "type": "chart",
-                                "section": self.current_section,
-                                "sub_section": self.current_subsection,
-                                "description": f"Image/Chart {img_index + 1} from page {page_num + 1}",
-                                "image_info": {
-                                    "width": base_image["width"],
-                                    "height": base_image["height"],
-                                    "ext": base_image["ext"],
-                                    "size": len(image_data)
-                                },
-                                "table_data": None  # Would need OCR or manual processing for chart data
-                            }
-
-                            page_content.append(chart_dict)
-                            self.logger.debug(f"Found image/chart on page {page_num + 1}")
-
-                        except Exception as e:
-                            self.logger.debug(f"Could not extract image {img_index} from page {page_num + 1}: {e}")
-
-            doc.close()
+            doc = fitz_page.parent
+            image_list = fitz_page.get_images(full=False)
+
+            for img_index, img in enumerate(image_list):
+                try:
+                    image_info = self.get_image_info(doc, img)
+
+                    # Create chart entry
+                    charts.append(Chart(
+                        section=None,
+                        sub_section=None,
+                        description=f"Image/Chart {img_index + 1} from page {page_num}",
+                        image_info=image_info
+                    ))
+                    self.logger.debug("Found image/chart on page %d", page_num)
+
+                except Exception as e:
+                    self.logger.debug("Could not extract image %d from page %d: %s", img_index, page_num, e)
 
         except Exception as e:
-            self.logger.warning(f"Error extracting charts/images: {e}")
+            self.logger.warning(f"Error extracting charts/images from page {page_num}: {e}")
 
-    def detect_section(self, line: str) -> Optional[str]:
+        return charts
+
+    def get_image_info(self, doc, img: Tuple) -> Dict[str, Any]:
         """
-        Detect if a line is a section heading.
+        Build image metadata from a get_images() entry without decoding pixel data.
+
+        Falls back to PyMuPDF's extract_image (which decodes the image) when
+        the entry does not carry the image dimensions.
 
         Args:
-            line (str): Text line to check
+            doc: PyMuPDF document
+            img (Tuple): Entry from page.get_images(full=False):
+                (xref, smask, width, height, bpc, colorspace, alt. colorspace, name, filter)
 
         Returns:
-            Section name if detected, None otherwise
+            Dict with width, height, extension and size in bytes
         """
-        for pattern in self.section_patterns:
-            match = re.match(pattern, line)
-            if match:
-                return match.group(1).strip()
-        return None
+        xref, _, width, height = img[:4]
+        image_filter = img[8]
+
+        if not (width and height):
+            base_image = doc.extract_image(xref)
+            return {
+                "width": base_image["width"],
+                "height": base_image["height"],
+                "ext": base_image["ext"],
+                "size": len(base_image["image"])
+            }
 
-    def detect_subsection(self, line: str) -> Optional[str]:
+        return {
+            "width": width,
+            "height": height,
+            "ext": _FILTER_EXTENSIONS.get(image_filter, "png"),
+            "size": len(doc.xref_stream_raw(xref))
+        }
+
+    def classify_line(self, line: str) -> Tuple[Optional[str], Optional[str]]:
         """
-        Detect if a line is a subsection heading.
+        Classify a line as a section or subsection heading.
 
         Args:
             line (str): Text line to check
 
         Returns:
-            Subsection name if detected, None otherwise
+            Tuple of (kind, heading text) where kind is "section", "subsection"
+            or None if the line is not a heading
         """
-        for pattern in self.subsection_patterns:
-            match = re.match(pattern, line)
-            if match:
-                return match.group(1).strip()
-        return None
-
-    def create_paragraph_dict(self, text: str, page_num: int, line_num: int) -> Dict[str, Any]:
+        # Cheap prefilter: every heading pattern starts (after optional
+        # whitespace) with an uppercase letter, a digit, or a letter and ")"
+        first = line[:1]
+        if not (first.isupper() or first.isdigit() or line[1:2] == ')' or first.isspace()):
+            return None, None
+
+        match = _HEADING_RE.match(line)
+        if not match:
+            return None, None
+
+        name = match.lastgroup
+        # Each pattern captures its heading text in the group right after
+        # the named wrapper group
+        text = match.group(_HEADING_RE.groupindex[name] + 1)
+        return name.rsplit('_', 1)[0], text.strip()
+
+    def create_paragraph(self, text: str, page_num: int, position: float) -> Paragraph:
         """
-        Create a paragraph dictionary.
+        Create a paragraph item.
 
         Args:
             text (str): Paragraph text
             page_num (int): Page number
-            line_num (int): Line number for positioning
+            position (float): Vertical position on the page, for sorting
 
         Returns:
-            Paragraph dictionary
+            Paragraph with section context left for assemble_page to fill in
         """
-        return {
-            "type": "paragraph",
-            "section": self.current_section,
-            "sub_section": self.current_subsection,
-            "text": text.strip(),
-            "_position": line_num  # For sorting
-        }
+        return Paragraph(
+            section=None,
+            sub_section=None,
+            text=text.strip(),
+            position=position
+        )
 
     def clean_table_data(self, table_data: List[List]) -> List[List[str]]:
         """
@@ -417,39 +873,14 @@ class PDFContentExtractor:
         """
         cleaned = []
         for row in table_data:
-            cleaned_row = []
-            for cell in row:
-                if cell is None:
-                    cleaned_row.append("")
-                else:
-                    # Convert to string and clean
-                    cell_str = str(cell).strip()
-                    # Remove extra whitespace
-                    cell_str = re.sub(r'\s+', ' ', cell_str)
-                    cleaned_row.append(cell_str)
-            cleaned.append(cleaned_row)
+            # Convert to string; split/join strips the cell and collapses
+            # internal runs of whitespace in one pass
+            cleaned.append([
+                ' '.join(str(cell).split()) if cell is not None else ""
+                for cell in row
+            ])
         return cleaned
 
-    def get_table_position(self, page, table_index: int) -> float:
-        """
-        Get approximate position of table on page.
-
-        Args:
-            page: pdfplumber page object
-            table_index (int): Index of table on page
-
-        Returns:
-            Approximate vertical position
-        """
-        try:
-            # This is a simplified approach
-            # In a more sophisticated implementation, you would use
-            # the actual bounding box coordinates
-            page_height = page.height
-            return (table_index + 1) * (page_height / 4)  # Rough estimation
-        except:
-            return 300  # Default middle position
-
     def save_to_json(self, content: Dict[str, Any], output_path: str):
         """
         Save extracted content to JSON file.
@@ -461,8 +892,8 @@ class PDFContentExtractor:
         output_file = Path(output_path)
 
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(content, f, indent=2, ensure_ascii=False)
+            with open(output_file, 'wb') as f:
+                f.write(_dumps(content))
 
             self.logger.info(f"JSON output saved to: {output_file}")
 
@@ -471,6 +902,47 @@ class PDFContentExtractor:
             raise
 
 
+# Per-process extractor and open documents, set up once by _init_worker in
+# each pool worker and kept open for the life of the process
+_worker_extractor: Optional[PDFContentExtractor] = None
+_worker_pdf = None
+_worker_doc = None
+
+
+def _init_worker(pdf_path: str, verbose: bool, table_backend: str):
+    """
+    Worker process initializer: create the extractor and open the PDF (with
+    both pdfplumber and PyMuPDF) once, shared by all of the worker's tasks.
+
+    The heading regex is compiled at module import, so workers get it as a
+    module global without recompiling it per task.
+
+    Args:
+        pdf_path (str): Path to the PDF file
+        verbose (bool): Enable verbose logging
+        table_backend (str): Table extractor to use
+    """
+    global _worker_extractor, _worker_pdf, _worker_doc
+    _worker_extractor = PDFContentExtractor(pdf_path, verbose=verbose, workers=1,
+                                            table_backend=table_backend)
+    _worker_pdf = pdfplumber.open(pdf_path)
+    _worker_doc = fitz.open(pdf_path)
+
+
+def _extract_page_range(start: int, stop: int) -> List[Dict[str, Any]]:
+    """
+    Worker process entry point: extract raw content for pages [start, stop).
+
+    Args:
+        start (int): Index of the first page (0-based)
+        stop (int): Index one past the last page
+
+    Returns:
+        List of raw page dictionaries
+    """
+    return _worker_extractor.extract_page_block(_worker_pdf, _worker_doc, start, stop)
+
+
 def main():
     """Main function to run the PDF extractor."""
     parser = argparse.ArgumentParser(
@@ -490,6 +962,18 @@ def main():
         action="store_true",
         help="Enable verbose logging"
     )
+    parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        help="Number of worker processes (default: number of CPU cores)",
+        default=None
+    )
+    parser.add_argument(
+        "--table-backend",
+        choices=TABLE_BACKENDS,
+        help="Table extractor to use (default: auto, pdfplumber with camelot fallback)",
+        default="auto"
+    )
 
     args = parser.parse_args()
 
@@ -500,14 +984,16 @@ def main():
 
     try:
         # Create extractor and process PDF
-        extractor = PDFContentExtractor(args.input_pdf, verbose=args.verbose)
-        content = extractor.extract_content()
-
-        # Save to JSON
-        extractor.save_to_json(content, args.output)
+        extractor = PDFContentExtractor(
+            args.input_pdf,
+            verbose=args.verbose,
+            workers=args.workers or os.cpu_count() or 1,
+            table_backend=args.table_backend
+        )
+        metadata = extractor.extract_to_json(args.output)
 
         print(f"✅ Successfully extracted content from {args.input_pdf}")
-        print(f"📄 Total pages processed: {content['metadata']['total_pages']}")
+        print(f"📄 Total pages processed: {metadata['total_pages']}")
         print(f"💾 Output saved to: {args.output}")
 
     except Exception as e: